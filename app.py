@@ -12,18 +12,29 @@ Author: Tiny Titans
 
 # Standard Library
 import os
-import json
-import base64
-from datetime import datetime
+import functools
+import hashlib
+import html
+import inspect
+import pickle
+import tempfile
+import textwrap
+import time
 from io import BytesIO
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 # Third-Party Libraries
 import streamlit as st
-import pandas as pd
-import docx
-import spacy
-from streamlit_lottie import st_lottie
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Heavy libraries (spaCy, streamlit_lottie, requests) are imported inside the
+# functions that use them to keep cold start fast.
+if TYPE_CHECKING:
+    import requests
+    import spacy
 
 # Local Imports
 from utils.resume_analyzer import ResumeAnalyzer
@@ -38,7 +49,7 @@ from config.courses import (
 from ui_components import (
     apply_modern_styles,
     hero_section,
-    feature_card,
+    feature_card_html,
     about_section,
     page_header
 )
@@ -56,6 +67,23 @@ PAGE_CONFIG = {
 
 CSS_FILES = ['style/styles_extracted.css']
 
+# Uploaded PDFs are served for preview through Streamlit static file serving
+PDF_PREVIEW_DIR = Path(__file__).parent / "static" / "previews"
+PDF_PREVIEW_URL = "app/static/previews"
+PDF_PREVIEW_MAX_AGE_SECONDS = 60 * 60
+PDF_PREVIEW_MAX_FILES = 50
+
+# Analysis results are persisted here so they survive app restarts. The
+# snapshots are unpickled on load and hold candidates' contact details, so
+# this directory must only be writable by the app and is pruned on write.
+ANALYSIS_CACHE_DIR = Path(__file__).parent / ".cache" / "analysis"
+ANALYSIS_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+ANALYSIS_CACHE_MAX_FILES = 500
+
+# Bump when the snapshot format or the app-side use of analysis results
+# changes; changes to the analyzer itself are covered by its source hash
+ANALYSIS_SNAPSHOT_VERSION = 1
+
 LOTTIE_ANIMATION_URL = "https://lottie.host/a24ca275-7e0c-4a06-8f2e-82a32af725b3/GRSUqxJajz.json"
 
 FILE_TYPES = {
@@ -63,13 +91,63 @@ FILE_TYPES = {
     'DOCX': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
 }
 
+SUPPORTED_FILE_TYPES = frozenset(FILE_TYPES.values())
+
 ATS_SCORE_THRESHOLDS = {
     'EXCELLENT': 80,
     'GOOD': 60
 }
 
+# Name or path of the spaCy pipeline; a path lets deployments point every
+# worker at one pre-serialized copy (e.g. saved once with nlp.to_disk)
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+
+SPACY_EXCLUDED_PIPES = ["tok2vec", "parser", "tagger", "ner", "lemmatizer", "attribute_ruler"]
+
+# Identifies the snapshot version and the analyzer code that produced a
+# snapshot, so results from older code are ignored after a deploy
+_ANALYSIS_SNAPSHOT_TAG = "v{}-{}".format(
+    ANALYSIS_SNAPSHOT_VERSION,
+    hashlib.blake2b(
+        Path(inspect.getfile(ResumeAnalyzer)).read_bytes(),
+        digest_size=8
+    ).hexdigest()
+)
+
+# Job role options are static, so the selectbox choices are built once
+_CATEGORIES = tuple(JOB_ROLES.keys())
+_ROLES_BY_CATEGORY = {
+    category: tuple(roles.keys())
+    for category, roles in JOB_ROLES.items()
+}
+_ROLE_VIEWS = {
+    (category, role): {
+        "title": html.escape(role),
+        "description": html.escape(info["description"]),
+        "skills_csv": html.escape(", ".join(info["required_skills"])),
+    }
+    for category, roles in JOB_ROLES.items()
+    for role, info in roles.items()
+}
+
+# Course recommendations for every known role, flattened into one lookup
+_COURSES_BY_ROLE = {
+    role: tuple(
+        tuple(course) for course in (
+            get_courses_for_role(role)
+            or COURSES_BY_CATEGORY.get(get_category_for_role(role), {}).get(role, [])
+        )
+    )
+    for roles in JOB_ROLES.values()
+    for role in roles
+}
+
+# Page names are cleaned for session state in a single translate pass
+_PAGE_NAME_TRANS = str.maketrans({" ": "_", "🔍": None, "🏠": None})
 
 EXTERNAL_FONTS_AND_ICONS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
 <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600&display=swap" rel="stylesheet">
 <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
 """
@@ -84,21 +162,28 @@ def initialize_page_config() -> None:
     st.set_page_config(**PAGE_CONFIG)
 
 
-def initialize_spacy_model() -> spacy.language.Language:
+@st.cache_resource(show_spinner=False)
+def initialize_spacy_model() -> "spacy.language.Language":
     """
     Load and initialize the SpaCy NLP model.
     
+    The model is cached with ``st.cache_resource`` so it is loaded once per
+    process and shared across reruns and sessions. No page currently calls
+    this: the Streamlit analyzer is keyword-based. It is kept so future NLP
+    code paths can load the model lazily rather than on every rerun.
+    
     Returns:
-        Loaded SpaCy model with parser and tagger disabled for performance.
+        Loaded SpaCy model without the unused pipeline components.
         
     Raises:
         SystemExit: If the SpaCy model is not installed.
     """
+    import spacy
     try:
-        return spacy.load("en_core_web_sm", disable=["parser", "tagger"])
+        return spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
     except OSError:
         st.error(
-            "The SpaCy model 'en_core_web_sm' is not installed. "
+            f"The SpaCy model '{SPACY_MODEL}' is not installed. "
             "Please redeploy after adding it to requirements.txt."
         )
         st.stop()
@@ -109,11 +194,391 @@ def initialize_environment() -> None:
     os.environ["STREAMLIT_WATCHER_TYPE"] = "none"
 
 
+@st.cache_data(show_spinner=False)
+def _load_css_blob(css_files: tuple) -> tuple:
+    """
+    Read all CSS files once and merge them into a single style block.
+    
+    Args:
+        css_files: Paths of the CSS files to load.
+        
+    Returns:
+        Tuple of (style_html, missing_files).
+    """
+    contents = []
+    missing_files = []
+    for css_file in css_files:
+        try:
+            contents.append(Path(css_file).read_text())
+        except FileNotFoundError:
+            missing_files.append(css_file)
+    
+    style_html = f'<style>{"".join(contents)}</style>' if contents else ''
+    return style_html, tuple(missing_files)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_session() -> "requests.Session":
+    """Return a shared HTTP session so connections are reused."""
+    import requests
+    return requests.Session()
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_lottie_json(url: str) -> Dict[str, Any]:
+    """
+    Download and parse a Lottie animation JSON.
+    
+    Cached for a day; failures raise and are therefore not cached.
+    """
+    response = _get_http_session().get(url, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+def load_lottie_url(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Load Lottie animation from a URL.
+    
+    Args:
+        url: URL of the Lottie animation JSON.
+        
+    Returns:
+        Animation data as dictionary, or None if loading fails.
+    """
+    import requests
+    try:
+        return _fetch_lottie_json(url)
+    except (requests.RequestException, ValueError):
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def get_resume_analyzer() -> ResumeAnalyzer:
+    """
+    Get the shared resume analyzer.
+    
+    The analyzer is stateless, so one instance is cached with
+    ``st.cache_resource`` and shared across reruns and sessions.
+    
+    Returns:
+        Process-wide ResumeAnalyzer instance.
+    """
+    return ResumeAnalyzer()
+
+
 def load_external_resources() -> None:
     """Load external fonts and icon libraries."""
     st.markdown(EXTERNAL_FONTS_AND_ICONS, unsafe_allow_html=True)
 
 
+# ============================================================================
+# FILE STORAGE
+# ============================================================================
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file so readers never see a partial file.
+    
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+        
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _prune_directory(
+    directory: Path,
+    pattern: str,
+    max_age_seconds: float,
+    max_files: int
+) -> None:
+    """
+    Delete files older than max_age_seconds, then the oldest beyond max_files.
+    
+    Args:
+        directory: Directory to prune.
+        pattern: Glob pattern of the files to consider.
+        max_age_seconds: Maximum file age, by modification time.
+        max_files: Maximum number of files to keep.
+    """
+    if not directory.is_dir():
+        return
+    
+    files = []
+    for path in directory.glob(pattern):
+        try:
+            files.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    
+    files.sort(reverse=True)
+    cutoff = time.time() - max_age_seconds
+    for index, (mtime, path) in enumerate(files):
+        if mtime < cutoff or index >= max_files:
+            path.unlink(missing_ok=True)
+
+
+def _prune_pdf_previews() -> None:
+    """Delete expired PDF previews and the oldest beyond the file cap."""
+    try:
+        _prune_directory(
+            PDF_PREVIEW_DIR,
+            "*.pdf",
+            PDF_PREVIEW_MAX_AGE_SECONDS,
+            PDF_PREVIEW_MAX_FILES
+        )
+    except OSError:
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def prune_pdf_previews_at_startup() -> bool:
+    """
+    Prune PDF previews left over from earlier runs, once per process.
+    
+    Returns:
+        True once the startup prune has run.
+    """
+    _prune_pdf_previews()
+    return True
+
+
+# ============================================================================
+# CACHED HELPERS
+# ============================================================================
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_extract(_analyzer: ResumeAnalyzer, file_bytes: bytes, mime: str) -> str:
+    """
+    Extract text from uploaded file bytes, cached by content.
+    
+    Args:
+        _analyzer: Analyzer providing the extraction routines (not hashed).
+        file_bytes: Raw bytes of the uploaded file.
+        mime: MIME type of the uploaded file, one of SUPPORTED_FILE_TYPES.
+        
+    Returns:
+        Extracted text as string.
+    """
+    if mime == FILE_TYPES['PDF']:
+        return _analyzer.extract_text_from_pdf(BytesIO(file_bytes))
+    return _analyzer.extract_text_from_docx(BytesIO(file_bytes))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_analyze(
+    _analyzer: ResumeAnalyzer,
+    text_hash: str,
+    _text: str,
+    role_info_frozen: tuple
+) -> Dict[str, Any]:
+    """
+    Analyze resume text, cached by text hash and role requirements.
+    
+    Args:
+        _analyzer: Analyzer performing the analysis (not hashed).
+        text_hash: Content hash of the resume text, used as the cache key.
+        _text: Resume text (not hashed; identified by text_hash).
+        role_info_frozen: Role details as returned by _freeze_role_info.
+        
+    Returns:
+        Analysis results dictionary.
+    """
+    snapshot_key = hashlib.blake2b(
+        f"{text_hash}:{role_info_frozen!r}".encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    
+    analysis = _load_analysis_snapshot(snapshot_key)
+    if analysis is None:
+        analysis = _analyzer.analyze_resume(
+            {'raw_text': _text},
+            dict(role_info_frozen)
+        )
+        _save_analysis_snapshot(snapshot_key, analysis)
+    return analysis
+
+
+def _analysis_snapshot_path(key: str) -> Path:
+    """
+    Get the snapshot file path for a key.
+    
+    The file name starts with the snapshot tag, so results produced by a
+    different snapshot version or analyzer source are never loaded.
+    
+    Args:
+        key: Snapshot key.
+        
+    Returns:
+        Path of the snapshot file.
+    """
+    return ANALYSIS_CACHE_DIR / f"{_ANALYSIS_SNAPSHOT_TAG}-{key}.pkl.zst"
+
+
+def _load_analysis_snapshot(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a previously saved analysis from the on-disk snapshot cache.
+    
+    Snapshots are unpickled, so ANALYSIS_CACHE_DIR must not be writable
+    by untrusted users. Snapshots past the maximum age are ignored.
+    
+    Args:
+        key: Snapshot key.
+        
+    Returns:
+        Analysis results dictionary, or None if no usable snapshot exists.
+    """
+    import zstandard
+    
+    snapshot_path = _analysis_snapshot_path(key)
+    try:
+        if snapshot_path.stat().st_mtime < time.time() - ANALYSIS_CACHE_MAX_AGE_SECONDS:
+            return None
+        compressed = snapshot_path.read_bytes()
+    except OSError:
+        return None
+    
+    try:
+        return pickle.loads(zstandard.ZstdDecompressor().decompress(compressed))
+    except (zstandard.ZstdError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _save_analysis_snapshot(key: str, analysis: Dict[str, Any]) -> None:
+    """
+    Save an analysis to the on-disk snapshot cache.
+    
+    Snapshots survive process restarts, unlike st.cache_data entries.
+    Snapshots from another snapshot version or analyzer source, snapshots
+    older than a week, and the oldest beyond the file cap are deleted
+    before each write.
+    
+    Args:
+        key: Snapshot key.
+        analysis: Analysis results dictionary.
+    """
+    import zstandard
+    
+    compressed = zstandard.ZstdCompressor(level=3).compress(pickle.dumps(analysis))
+    snapshot_path = _analysis_snapshot_path(key)
+    try:
+        for stale_path in ANALYSIS_CACHE_DIR.glob("*.pkl.zst"):
+            if not stale_path.name.startswith(_ANALYSIS_SNAPSHOT_TAG + "-"):
+                stale_path.unlink(missing_ok=True)
+        _prune_directory(
+            ANALYSIS_CACHE_DIR,
+            "*.pkl.zst",
+            ANALYSIS_CACHE_MAX_AGE_SECONDS,
+            ANALYSIS_CACHE_MAX_FILES
+        )
+        _write_bytes_atomic(snapshot_path, compressed)
+    except OSError:
+        pass
+
+
+def _youtube_video_id(video_url: str) -> str:
+    """
+    Extract the video ID from a YouTube URL.
+    
+    Args:
+        video_url: youtu.be or youtube.com/watch URL.
+        
+    Returns:
+        YouTube video ID.
+    """
+    parsed = urlparse(video_url)
+    if parsed.netloc.endswith("youtu.be"):
+        return parsed.path.lstrip("/")
+    return parse_qs(parsed.query).get("v", [""])[0]
+
+
+@st.cache_data(show_spinner=False)
+def _video_section_html(videos_dict: Dict[str, List[tuple]]) -> str:
+    """
+    Build the thumbnail grids for a section of videos as one HTML block.
+    
+    Each video is shown as a linked thumbnail rather than an embedded
+    player, so no YouTube iframe is loaded until the user opens one.
+    
+    Args:
+        videos_dict: Dictionary mapping categories to video lists.
+        
+    Returns:
+        HTML with a heading and thumbnail grid per category, wrapped in
+        a single video-section container.
+    """
+    sections = []
+    for category, videos in videos_dict.items():
+        cards = []
+        for video_title, video_url in videos:
+            title = html.escape(video_title)
+            thumbnail_url = (
+                f"https://img.youtube.com/vi/{_youtube_video_id(video_url)}/mqdefault.jpg"
+            )
+            # Dedented and stripped so the joined cards stay one HTML block
+            cards.append(textwrap.dedent(f"""
+                <a class="video-card" href="{html.escape(video_url)}" target="_blank">
+                    <img src="{thumbnail_url}" alt="{title}" loading="lazy">
+                    <div class="video-title">{title}</div>
+                </a>
+            """).strip())
+        sections.append(
+            f'<h3>{html.escape(category)}</h3>'
+            f'<div class="video-grid">{"".join(cards)}</div>'
+        )
+    # One root element with no blank lines keeps the whole tab a single
+    # HTML block, so no heading or grid can fall through to Markdown
+    return f'<div class="video-section">{"".join(sections)}</div>'
+
+
+def _freeze_role_info(role_info: Dict[str, Any]) -> tuple:
+    """
+    Convert role details into a hashable tuple of items.
+    
+    Nested values are frozen recursively, so entries such as the
+    ``recommended_skills`` dict of lists are hashable as well.
+    
+    Args:
+        role_info: Dictionary containing role details.
+        
+    Returns:
+        Tuple of (key, value) pairs; ``dict(...)`` restores the top level.
+    """
+    return tuple((key, _freeze_value(value)) for key, value in role_info.items())
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists into tuples.
+    
+    Args:
+        value: Value to freeze.
+        
+    Returns:
+        Dicts as tuples of (key, value) pairs, lists as tuples, sets as
+        frozensets and other values unchanged.
+    """
+    if isinstance(value, dict):
+        return tuple((key, _freeze_value(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_value(item) for item in value)
+    return value
+
+
 # ============================================================================
 # MAIN APPLICATION CLASS
 # ============================================================================
@@ -149,15 +614,41 @@ class ResumeApp:
             "HOME": self.render_home,
             "RESUME ANALYZER": self.render_analyzer,
         }
+        self._page_by_cleaned_name = {
+            self._clean_page_name(name): renderer
+            for name, renderer in self.pages.items()
+        }
     
     def _initialize_components(self) -> None:
         """Initialize application components and data structures."""
-        self.analyzer = ResumeAnalyzer()
+        self.analyzer = get_resume_analyzer()
         self.job_roles = JOB_ROLES
     
     def _load_resources(self) -> None:
-        """Load all required external resources (CSS, fonts, etc.)."""
+        """
+        Load all required external resources (CSS, fonts, animation).
+        
+        The Lottie animation is fetched on a worker thread while the CSS
+        is read and emitted, so a cold start waits for the slower of the
+        two rather than both in sequence.
+        """
+        if st.session_state.get('lottie_animation'):
+            self._load_styles()
+            return
+        
+        with ThreadPoolExecutor(
+            max_workers=1,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        ) as executor:
+            lottie_future = executor.submit(load_lottie_url, LOTTIE_ANIMATION_URL)
+            self._load_styles()
+            st.session_state.lottie_animation = lottie_future.result()
+    
+    def _load_styles(self) -> None:
+        """Emit CSS files, global styles and external fonts."""
         self._load_css_files()
+        apply_modern_styles()
         load_external_resources()
     
     # ========================================================================
@@ -166,32 +657,11 @@ class ResumeApp:
     
     def _load_css_files(self) -> None:
         """Load all external CSS files into the application."""
-        for css_file in CSS_FILES:
-            try:
-                with open(css_file) as f:
-                    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-            except FileNotFoundError:
-                st.warning(f"CSS file not found: {css_file}")
-    
-    @staticmethod
-    def load_lottie_url(url: str) -> Optional[Dict[str, Any]]:
-        """
-        Load Lottie animation from a URL.
-        
-        Args:
-            url: URL of the Lottie animation JSON.
-            
-        Returns:
-            Animation data as dictionary, or None if loading fails.
-        """
-        import requests
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-        except requests.RequestException:
-            pass
-        return None
+        css_blob, missing_files = _load_css_blob(tuple(CSS_FILES))
+        for css_file in missing_files:
+            st.warning(f"CSS file not found: {css_file}")
+        if css_blob:
+            st.markdown(css_blob, unsafe_allow_html=True)
     
     # ========================================================================
     # PAGE: HOME
@@ -199,8 +669,6 @@ class ResumeApp:
     
     def render_home(self):
         """Render the home/landing page"""
-        apply_modern_styles()
-        
         # Hero Section
         hero_section(
             "AI QuickScreener",
@@ -212,27 +680,27 @@ class ResumeApp:
         )
         
         # Feature Cards
-        st.markdown('<div class="feature-grid">', unsafe_allow_html=True)
-        
-        feature_card(
-            "",
-            "Intelligent Candidate Screening",
-            "Automatically analyze and rank resumes using advanced natural language "
-            "processing and machine learning. Our intelligent algorithms evaluate "
-            "candidate qualifications, skills, and experience against your job "
-            "requirements with precision, saving you hours of manual review time."
-        )
-        
-        feature_card(
-            "",
-            "Recommendations & Analytics",
-            "Get comprehensive analytics and visualizations of your candidate pool. "
-            "Understand skill distributions, identify top talent instantly, and make "
-            "informed hiring decisions backed by data. Reduce time-to-hire by up to "
-            "75% while improving candidate quality."
+        grid_html = (
+            '<div class="feature-grid">'
+            + feature_card_html(
+                "",
+                "Intelligent Candidate Screening",
+                "Automatically analyze and rank resumes using advanced natural language "
+                "processing and machine learning. Our intelligent algorithms evaluate "
+                "candidate qualifications, skills, and experience against your job "
+                "requirements with precision, saving you hours of manual review time."
+            )
+            + feature_card_html(
+                "",
+                "Recommendations & Analytics",
+                "Get comprehensive analytics and visualizations of your candidate pool. "
+                "Understand skill distributions, identify top talent instantly, and make "
+                "informed hiring decisions backed by data. Reduce time-to-hire by up to "
+                "75% while improving candidate quality."
+            )
+            + '</div>'
         )
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(grid_html, unsafe_allow_html=True)
         
         # Call-to-Action Button
         self._render_cta_button()
@@ -262,8 +730,6 @@ class ResumeApp:
     
     def render_analyzer(self) -> None:
         """Render the resume analyzer page."""
-        apply_modern_styles()
-        
         page_header(
             "Resume Analyzer",
             "Get instant AI-powered feedback to optimize your resume"
@@ -273,7 +739,7 @@ class ResumeApp:
         selected_category, selected_role, role_info = self._render_job_selection()
         
         # Display Role Information
-        self._display_role_info(selected_role, role_info)
+        self._display_role_info(selected_category, selected_role)
         
         # File Upload and Analysis
         uploaded_file = st.file_uploader(
@@ -298,32 +764,29 @@ class ResumeApp:
         Returns:
             Tuple of (selected_category, selected_role, role_info)
         """
-        categories = list(self.job_roles.keys())
-        selected_category = st.selectbox("Job Category", categories)
-        
-        roles = list(self.job_roles[selected_category].keys())
-        selected_role = st.selectbox("Specific Role", roles)
+        selected_category = st.selectbox("Job Category", _CATEGORIES)
+        selected_role = st.selectbox("Specific Role", _ROLES_BY_CATEGORY[selected_category])
         
         role_info = self.job_roles[selected_category][selected_role]
         
         return selected_category, selected_role, role_info
     
-    def _display_role_info(self, selected_role: str, role_info: Dict[str, Any]) -> None:
+    def _display_role_info(self, selected_category: str, selected_role: str) -> None:
         """
         Display information about the selected job role.
         
         Args:
+            selected_category: Name of the selected category.
             selected_role: Name of the selected role.
-            role_info: Dictionary containing role details.
         """
-        required_skills = ', '.join(role_info['required_skills'])
+        role_view = _ROLE_VIEWS[(selected_category, selected_role)]
         
         st.markdown(f"""
         <div class='role-info-card'>
-            <h3>{selected_role}</h3>
-            <p>{role_info['description']}</p>
+            <h3>{role_view['title']}</h3>
+            <p>{role_view['description']}</p>
             <h4>Required Skills:</h4>
-            <p>{required_skills}</p>
+            <p>{role_view['skills_csv']}</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -343,9 +806,14 @@ class ResumeApp:
             selected_category: Selected job category.
             role_info: Dictionary containing role details.
         """
-        self._display_uploaded_file(uploaded_file)
+        # Read the upload once and share the bytes downstream
+        file_bytes = uploaded_file.getvalue()
+        file_type = uploaded_file.type
+        
+        self._display_uploaded_file(file_bytes, file_type)
         self._analyze_uploaded_resume(
-            uploaded_file,
+            file_bytes,
+            file_type,
             selected_role,
             selected_category,
             role_info
@@ -355,39 +823,43 @@ class ResumeApp:
     # FILE HANDLING
     # ========================================================================
     
-    def _display_uploaded_file(self, uploaded_file) -> None:
+    def _display_uploaded_file(self, file_bytes: bytes, file_type: str) -> None:
         """
         Display the uploaded file with preview and download options.
         
         Args:
-            uploaded_file: Streamlit uploaded file object.
+            file_bytes: Raw bytes of the uploaded file.
+            file_type: MIME type of the uploaded file.
         """
-        if uploaded_file.type == FILE_TYPES['PDF']:
-            self._display_pdf_preview(uploaded_file)
-        elif uploaded_file.type == FILE_TYPES['DOCX']:
+        if file_type == FILE_TYPES['PDF']:
+            self._display_pdf_preview(file_bytes)
+        elif file_type == FILE_TYPES['DOCX']:
             st.warning("DOCX files are uploaded but not displayed as embedded PDF.")
         else:
             st.error("Unsupported file format. Please upload PDF or DOCX.")
     
-    def _display_pdf_preview(self, uploaded_file) -> None:
+    def _display_pdf_preview(self, pdf_data: bytes) -> None:
         """
         Display PDF preview with download option.
         
         Args:
-            uploaded_file: Streamlit uploaded file object (PDF).
+            pdf_data: Raw bytes of the uploaded PDF.
         """
-        pdf_data = uploaded_file.read()
+        # Enforce the preview lifetime on every render, not only on writes
+        _prune_pdf_previews()
         
         if pdf_data:
-            base64_pdf = base64.b64encode(pdf_data).decode("utf-8")
-            
             # Preview Option
             if st.checkbox("Preview Resume (PDF)"):
-                pdf_display = (
-                    f'<iframe src="data:application/pdf;base64,{base64_pdf}" '
-                    f'width="100%" height="700"></iframe>'
-                )
-                st.markdown(pdf_display, unsafe_allow_html=True)
+                preview_url = self._get_pdf_preview_url(pdf_data)
+                if preview_url:
+                    pdf_display = (
+                        f'<iframe src="{preview_url}" '
+                        f'width="100%" height="700"></iframe>'
+                    )
+                    st.markdown(pdf_display, unsafe_allow_html=True)
+                else:
+                    st.warning("PDF preview is unavailable right now.")
             
             # Download Button
             st.download_button(
@@ -396,9 +868,35 @@ class ResumeApp:
                 file_name="uploaded_resume.pdf",
                 mime=FILE_TYPES['PDF']
             )
+    
+    @staticmethod
+    def _get_pdf_preview_url(pdf_data: bytes) -> Optional[str]:
+        """
+        Write a PDF to the static folder once and return its URL.
+        
+        The file is named by a hash of its content, so repeated reruns
+        reuse the existing file instead of inlining the PDF as base64.
+        Previews are public and contain personal data, so the caller
+        prunes old ones on every render (see _prune_pdf_previews).
+        
+        Args:
+            pdf_data: Raw PDF bytes.
             
-            # Reset file pointer
-            uploaded_file.seek(0)
+        Returns:
+            URL of the PDF served by Streamlit's static file server, or
+            None if the preview could not be written.
+        """
+        file_name = hashlib.blake2b(pdf_data, digest_size=16).hexdigest() + ".pdf"
+        preview_path = PDF_PREVIEW_DIR / file_name
+        try:
+            try:
+                # Keep previews that are still in use from being pruned
+                os.utime(preview_path)
+            except FileNotFoundError:
+                _write_bytes_atomic(preview_path, pdf_data)
+        except OSError:
+            return None
+        return f"{PDF_PREVIEW_URL}/{file_name}"
     
     # ========================================================================
     # RESUME ANALYSIS
@@ -406,7 +904,8 @@ class ResumeApp:
     
     def _analyze_uploaded_resume(
         self,
-        uploaded_file,
+        file_bytes: bytes,
+        file_type: str,
         selected_role: str,
         selected_category: str,
         role_info: Dict[str, Any]
@@ -415,20 +914,23 @@ class ResumeApp:
         Extract text from uploaded file and perform resume analysis.
         
         Args:
-            uploaded_file: Streamlit uploaded file object.
+            file_bytes: Raw bytes of the uploaded file.
+            file_type: MIME type of the uploaded file.
             selected_role: Selected job role.
             selected_category: Selected job category.
             role_info: Dictionary containing role details.
         """
         with st.spinner("Analyzing your document..."):
-            text = self._extract_text_from_file(uploaded_file)
+            text = self._extract_text_from_file(file_bytes, file_type)
             
             if not text:
                 return
             
-            analysis = self.analyzer.analyze_resume(
-                {'raw_text': text},
-                role_info
+            analysis = _cached_analyze(
+                self.analyzer,
+                hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(),
+                text,
+                _freeze_role_info(role_info)
             )
             
             # Validate Document Type
@@ -442,26 +944,23 @@ class ResumeApp:
                 selected_category
             )
     
-    def _extract_text_from_file(self, uploaded_file) -> str:
+    def _extract_text_from_file(self, file_bytes: bytes, file_type: str) -> str:
         """
         Extract text content from uploaded file.
         
         Args:
-            uploaded_file: Streamlit uploaded file object.
+            file_bytes: Raw bytes of the uploaded file.
+            file_type: MIME type of the uploaded file.
             
         Returns:
             Extracted text as string, empty string on error.
         """
+        # Unsupported types were already reported by _display_uploaded_file
+        if file_type not in SUPPORTED_FILE_TYPES:
+            return ""
+        
         try:
-            uploaded_file.seek(0)
-            
-            if uploaded_file.type == FILE_TYPES['PDF']:
-                return self.analyzer.extract_text_from_pdf(uploaded_file)
-            elif uploaded_file.type == FILE_TYPES['DOCX']:
-                return self.analyzer.extract_text_from_docx(uploaded_file)
-            else:
-                return uploaded_file.getvalue().decode()
-                
+            return _cached_extract(self.analyzer, file_bytes, file_type)
         except Exception as e:
             st.error(f"Error reading file: {str(e)}")
             return ""
@@ -541,6 +1040,7 @@ class ResumeApp:
         """, unsafe_allow_html=True)
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def _get_score_color_class(score: int) -> str:
         """
         Determine the color class based on ATS score.
@@ -565,23 +1065,28 @@ class ResumeApp:
         Args:
             analysis: Analysis results dictionary.
         """
-        st.markdown(
-            "<div class='feature-card'><h2>Skills Match</h2>",
-            unsafe_allow_html=True
-        )
-        
         # Keyword Match Percentage
         keyword_score = int(analysis.get('keyword_match', {}).get('score', 0))
-        st.metric("Keyword Match", f"{keyword_score}%")
         
         # Missing Skills
         missing_skills = analysis['keyword_match'].get('missing_skills', [])
+        missing_html = ''
         if missing_skills:
-            st.markdown("#### Missing Skills:")
-            for skill in missing_skills:
-                st.markdown(f"- {skill}")
+            missing_items = ''.join(
+                f"<li>{html.escape(skill)}</li>" for skill in missing_skills
+            )
+            missing_html = f"<h4>Missing Skills:</h4><ul>{missing_items}</ul>"
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(f"""
+        <div class="feature-card">
+            <h2>Skills Match</h2>
+            <div class="skills-metric">
+                <div class="skills-metric-label">Keyword Match</div>
+                <div class="skills-metric-value">{keyword_score}%</div>
+            </div>
+            {missing_html}
+        </div>
+        """, unsafe_allow_html=True)
     
     # ========================================================================
     # RECOMMENDATIONS
@@ -605,11 +1110,12 @@ class ResumeApp:
             st.info("No specific courses found for this role.")
             return
         
-        # Display courses in two columns
-        cols = st.columns(2)
-        for i, course in enumerate(courses[:6]):
-            with cols[i % 2]:
-                self._render_course_card(course)
+        # Display courses in a two-column grid
+        cards_html = ''.join(self._course_card_html(course) for course in courses[:6])
+        st.markdown(
+            f'<div class="course-grid">{cards_html}</div>',
+            unsafe_allow_html=True
+        )
     
     def _get_relevant_courses(
         self,
@@ -626,29 +1132,27 @@ class ResumeApp:
         Returns:
             List of course tuples (name, url).
         """
-        courses = get_courses_for_role(selected_role)
-        
-        if not courses:
-            category = get_category_for_role(selected_role)
-            courses = COURSES_BY_CATEGORY.get(category, {}).get(selected_role, [])
-        
-        return courses
+        return list(_COURSES_BY_ROLE.get(selected_role, ()))
     
     @staticmethod
-    def _render_course_card(course: tuple) -> None:
+    def _course_card_html(course: tuple) -> str:
         """
-        Render a single course card.
+        Build the HTML for a single course card.
         
         Args:
             course: Tuple of (course_name, course_url).
+            
+        Returns:
+            Course card HTML.
         """
         course_name, course_url = course
-        st.markdown(f"""
-        <div class="course-card">
-            <h4>{course_name}</h4>
-            <a href='{course_url}' target='_blank'>View Course</a>
-        </div>
-        """, unsafe_allow_html=True)
+        # Dedented and stripped so the joined cards stay one HTML block
+        return textwrap.dedent(f"""
+            <div class="course-card">
+                <h4>{course_name}</h4>
+                <a href='{course_url}' target='_blank'>View Course</a>
+            </div>
+        """).strip()
     
     def _render_learning_resources(self) -> None:
         """Render learning resource videos in tabbed interface."""
@@ -668,14 +1172,7 @@ class ResumeApp:
         Args:
             videos_dict: Dictionary mapping categories to video lists.
         """
-        for category, videos in videos_dict.items():
-            st.subheader(category)
-            cols = st.columns(2)
-            
-            for i, video in enumerate(videos):
-                with cols[i % 2]:
-                    video_title, video_url = video
-                    st.video(video_url)
+        st.markdown(_video_section_html(videos_dict), unsafe_allow_html=True)
     
     # ========================================================================
     # NAVIGATION
@@ -683,9 +1180,11 @@ class ResumeApp:
     
     def _render_sidebar(self) -> None:
         """Render the sidebar with navigation and branding."""
+        from streamlit_lottie import st_lottie
+        
         with st.sidebar:
             # Lottie Animation
-            animation_data = self.load_lottie_url(LOTTIE_ANIMATION_URL)
+            animation_data = st.session_state.get('lottie_animation')
             if animation_data:
                 st_lottie(animation_data, height=200, key="sidebar_animation")
             
@@ -710,6 +1209,7 @@ class ResumeApp:
         st.rerun()
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _clean_page_name(page_name: str) -> str:
         """
         Clean page name for session state storage.
@@ -720,11 +1220,7 @@ class ResumeApp:
         Returns:
             Cleaned page name.
         """
-        return (page_name.lower()
-                .replace(" ", "_")
-                .replace("🔍", "")
-                .replace("🏠", "")
-                .strip())
+        return page_name.lower().translate(_PAGE_NAME_TRANS).strip()
     
     def _get_current_page_renderer(self) -> callable:
         """
@@ -734,16 +1230,7 @@ class ResumeApp:
             Page render function.
         """
         current_page = st.session_state.get('page', 'home')
-        
-        page_mapping = {
-            self._clean_page_name(name): name
-            for name in self.pages.keys()
-        }
-        
-        if current_page in page_mapping:
-            return self.pages[page_mapping[current_page]]
-        else:
-            return self.render_home
+        return self._page_by_cleaned_name.get(current_page, self.render_home)
     
     # ========================================================================
     # MAIN EXECUTION
@@ -777,8 +1264,8 @@ def main():
     # Page Configuration
     initialize_page_config()
     
-    # Initialize SpaCy
-    nlp = initialize_spacy_model()
+    # Storage Cleanup
+    prune_pdf_previews_at_startup()
     
     # Create and Run Application
     app = ResumeApp()
@@ -1,22 +1,126 @@
 from flask import Flask, render_template, request, send_from_directory, redirect, url_for
 import os
-from analyzer import ResumeAnalyzer
+import re
 import spacy
-from collections import Counter
+from spacy.matcher import PhraseMatcher
+import threading
+import time
 from datetime import datetime
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+# Name or path of the spaCy pipeline
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+
+# Only tokenization and sentence boundaries are used
+SPACY_EXCLUDED_PIPES = ["tok2vec", "tagger", "parser", "ner", "lemmatizer", "attribute_ruler"]
+
+# Common technical skills keywords
+_TECH_SKILLS = frozenset({
+    "python", "java", "javascript", "react", "node.js", "sql",
+    "html", "css", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics"
+})
+
+# Matches experience phrases such as "5 years", "3+ yrs" or "1 year"
+_YEARS_RE = re.compile(r"\b(\d{1,2})\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+
+
+def _profile_score(word_count, sentence_count, skills_count, experience_years):
+    """Score a single profile from its metrics (0-100)"""
+    score = 0.0
+    
+    # Word count scoring (0-25 points)
+    if word_count >= 300:
+        score += 25
+    else:
+        score += (word_count / 300) * 25
+    
+    # Skills scoring (0-35 points)
+    if skills_count >= 8:
+        score += 35
+    else:
+        score += (skills_count / 8) * 35
+    
+    # Experience scoring (0-40 points)
+    if experience_years >= 5:
+        score += 40
+    else:
+        score += (experience_years / 5) * 40
+    
+    return min(round(score), 100)
+
+
+def _profile_score_batch(word_counts, sentence_counts, skills_counts, experience_years, out):
+    """Score many profiles at once, writing the results into out"""
+    for i in prange(word_counts.shape[0]):
+        out[i] = _profile_score(
+            word_counts[i], sentence_counts[i], skills_counts[i], experience_years[i]
+        )
+    return out
+
+
+# Compile the scoring kernels when numba is available; the plain Python
+# versions above are used otherwise
+if numba is not None:
+    _profile_score = numba.njit(cache=True)(_profile_score)
+    _profile_score_batch = numba.njit(parallel=True, cache=True)(_profile_score_batch)
+
+
+def _warmup_kernels():
+    """Call each scoring kernel once so compilation happens ahead of requests
+    
+    Uses the same float64 argument types as the real callers, so no new
+    specialization is compiled on the first request.
+    """
+    sample = np.zeros(1, dtype=np.float64)
+    _profile_score(0.0, 0.0, 0.0, 0.0)
+    _profile_score_batch(sample, sample, sample, sample, np.empty(1, dtype=np.int64))
+
+
+# Compile (or load from the on-disk cache) in the background while the
+# spaCy model loads, so the first request does not pay the JIT cost
+if numba is not None:
+    threading.Thread(target=_warmup_kernels, name="numba-warmup", daemon=True).start()
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+@app.template_filter("isoformat")
+def format_timestamp(timestamp_ns):
+    """Format a nanosecond timestamp for display"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(timespec="seconds")
+
 class ResumeAnalyzer:
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        # Only tokenization and sentence boundaries are used, so the heavy
+        # pipeline components are not loaded and the sentencizer provides doc.sents
+        self.nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
+        self.nlp.add_pipe("sentencizer")
+        
+        # Match skills case-insensitively in compiled code instead of a Python loop
+        self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        self.matcher.add("SKILLS", [self.nlp.make_doc(skill) for skill in _TECH_SKILLS])
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
-        
+        return self._analyze_doc(self.nlp(resume_text), resume_text)
+    
+    def analyze_resumes_batch(self, resume_texts, batch_size=64):
+        """Analyze many resumes, running spaCy over them in batches"""
+        resume_texts = list(resume_texts)
+        docs = self.nlp.pipe(resume_texts, batch_size=batch_size)
+        return [self._analyze_doc(doc, text) for doc, text in zip(docs, resume_texts)]
+    
+    def _analyze_doc(self, doc, resume_text):
+        """Compute metrics for a processed resume"""
         # Basic metrics
         word_count = len(resume_text.split())
         sentence_count = len(list(doc.sents))
@@ -25,7 +129,7 @@ class ResumeAnalyzer:
         skills = self._extract_skills(doc)
         
         # Experience analysis
-        experience_years = self._analyze_experience(doc)
+        experience_years = self._analyze_experience(resume_text)
         
         # Calculate profile score
         profile_score = self._calculate_profile_score(
@@ -33,7 +137,7 @@ class ResumeAnalyzer:
         )
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time_ns(),
             "metrics": {
                 "word_count": word_count,
                 "sentence_count": sentence_count,
@@ -49,62 +153,33 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        return {doc[start:end].text for _, start, end in self.matcher(doc)}
     
-    def _analyze_experience(self, doc):
+    def _analyze_experience(self, text):
         """Analyze years of experience"""
         # Simple heuristic - look for number + "years"
-        experience_years = 0
-        for token in doc:
-            if token.like_num and token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                if "year" in next_token.text.lower():
-                    try:
-                        experience_years = max(experience_years, int(token.text))
-                    except ValueError:
-                        continue
-        return experience_years
+        return max((int(match.group(1)) for match in _YEARS_RE.finditer(text)), default=0)
     
     def _calculate_profile_score(self, word_count, sentence_count, skills_count, experience_years):
         """Calculate profile score based on various metrics"""
-        score = 0
-        
-        # Word count scoring (0-25 points)
-        if word_count >= 300:
-            score += 25
-        else:
-            score += (word_count / 300) * 25
-        
-        # Skills scoring (0-35 points)
-        if skills_count >= 8:
-            score += 35
-        else:
-            score += (skills_count / 8) * 35
-        
-        # Experience scoring (0-40 points)
-        if experience_years >= 5:
-            score += 40
-        else:
-            score += (experience_years / 5) * 40
-        
-        return min(round(score), 100)
+        # Pass floats so the call hits the float64 specialization compiled by
+        # _warmup_kernels instead of compiling a new int64 one on first use
+        return int(_profile_score(
+            float(word_count), float(sentence_count),
+            float(skills_count), float(experience_years)
+        ))
+    
+    def calculate_profile_scores(self, word_counts, sentence_counts, skills_counts, experience_years):
+        """Calculate profile scores for many candidates in one call"""
+        word_counts = np.asarray(word_counts, dtype=np.float64)
+        out = np.empty(word_counts.shape[0], dtype=np.int64)
+        return _profile_score_batch(
+            word_counts,
+            np.asarray(sentence_counts, dtype=np.float64),
+            np.asarray(skills_counts, dtype=np.float64),
+            np.asarray(experience_years, dtype=np.float64),
+            out
+        )
     
     def _generate_suggestions(self, word_count, sentence_count, skills, experience_years):
         """Generate improvement suggestions based on analysis"""
@@ -141,7 +216,11 @@ class ResumeAnalyzer:
             })
             
         return suggestions
-    
+
+
+# Shared analyzer so the spaCy model is loaded once, not per request
+ANALYZER = ResumeAnalyzer()
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -163,8 +242,7 @@ def upload_file():
         with open(file_path, 'r') as f:
             resume_text = f.read()
         
-        analyzer = ResumeAnalyzer()
-        analysis_result = analyzer.analyze_resume(resume_text)
+        analysis_result = ANALYZER.analyze_resume(resume_text)
         
         return render_template('result.html', analysis=analysis_result, resume_filename=file.filename)
 
@@ -1,3 +1,5 @@
+import textwrap
+
 import streamlit as st
 
 def apply_modern_styles():
@@ -35,9 +37,10 @@ def hero_section(title, subtitle=None, description=None):
         unsafe_allow_html=True
     )
 
-def feature_card(icon, title, description):
-    """Render a modern feature card with hover effects"""
-    st.markdown(f"""
+def feature_card_html(icon, title, description):
+    """Build the HTML for a modern feature card with hover effects"""
+    # Dedented and stripped so several cards can be joined into one HTML block
+    return textwrap.dedent(f"""
         <div class="card feature-card">
             <div class="feature-icon icon-pulse">
                 <i class="{icon}"></i>
@@ -45,7 +48,11 @@ def feature_card(icon, title, description):
             <h3>{title}</h3>
             <p>{description}</p>
         </div>
-    """, unsafe_allow_html=True)
+    """).strip()
+
+def feature_card(icon, title, description):
+    """Render a modern feature card with hover effects"""
+    st.markdown(feature_card_html(icon, title, description), unsafe_allow_html=True)
 
 def about_section(content, image_path=None, social_links=None):
     """Render a modern about section with profile image and social links"""
@@ -1,5 +1,3 @@
-import PyPDF2
-import docx
 import re
 from io import BytesIO
 
@@ -9,6 +7,7 @@ class ResumeParser:
         
     def extract_text_from_pdf(self, pdf_file):
         try:
+            import PyPDF2
             pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
             text = ""
             for page in pdf_reader.pages:
@@ -20,6 +19,7 @@ class ResumeParser:
             
     def extract_text_from_docx(self, docx_file):
         try:
+            import docx
             doc = docx.Document(BytesIO(docx_file.read()))
             text = ""
             for paragraph in doc.paragraphs: